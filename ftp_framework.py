@@ -6,9 +6,11 @@ Production-style, class-based template for FTP/SFTP ingestion.
 - Hash validation helpers
 """
 from __future__ import annotations
-import dataclasses, fnmatch, hashlib, logging
+import asyncio, calendar, dataclasses, fnmatch, functools, hashlib, logging, mmap, os, re, shutil, socket, sys, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 # Optional dependency for SFTP
 try:
@@ -17,17 +19,69 @@ try:
 except Exception:
     _HAS_PARAMIKO = False
 
+# Optional dependency for asyncio-based SFTP
+try:
+    import asyncssh  # type: ignore
+    _HAS_ASYNCSSH = True
+except Exception:
+    _HAS_ASYNCSSH = False
+
+# Optional dependency for BLAKE3 digests (SIMD + multithreaded hashing)
+try:
+    import blake3  # type: ignore
+    _HAS_BLAKE3 = True
+except Exception:
+    _HAS_BLAKE3 = False
+
 import ftplib  # built-in FTP
 
+# SFTP transport tuning: a large SSH window and socket buffers keep many
+# reads in flight on high-latency links instead of stalling on each ACK.
+_SFTP_WINDOW_SIZE = 64 * 1024 * 1024
+_SFTP_MAX_PACKET_SIZE = 32768
+_SOCKET_BUFFER_SIZE = 32 * 1024 * 1024
+_COPY_CHUNK_SIZE = 1 << 20
+# Local writes are append-only; a large buffer coalesces small network
+# blocks (ftplib delivers ~8KB at a time) into few write() syscalls.
+_WRITE_BUFFER_SIZE = 8 << 20
+_MMAP_32BIT_LIMIT = 1 << 30
+# Batches smaller than this are hashed inline; a thread pool isn't worth starting.
+_INLINE_HASH_MAX_BYTES = 8 << 20
+# asyncssh keeps this many reads of this size outstanding per file.
+_ASYNC_BLOCK_SIZE = 256 * 1024
+_ASYNC_MAX_REQUESTS = 128
+
 LOG = logging.getLogger("ftp_framework")
 if not LOG.handlers:
     logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 
+# FileSpec carries one expected-digest field per supported algorithm.
+_SUPPORTED_ALGOS = ("md5", "blake3")
+
+def _check_algo(algo: str) -> None:
+    if algo not in _SUPPORTED_ALGOS:
+        raise ValueError(f"unsupported digest algo {algo!r}; expected one of {', '.join(_SUPPORTED_ALGOS)}")
+
 @dataclasses.dataclass(frozen=True)
 class FileSpec:
     path: str
     size: Optional[int] = None
     md5: Optional[str] = None
+    blake3: Optional[str] = None
+    algo: str = "md5"
+    mtime: Optional[int] = None  # remote modification time, epoch seconds
+
+    def __post_init__(self) -> None:
+        _check_algo(self.algo)
+
+    @property
+    def digest(self) -> Optional[str]:
+        """Expected digest for ``algo``, if the remote published one."""
+        return self.blake3 if self.algo == "blake3" else self.md5
+
+@dataclasses.dataclass(frozen=True)
+class _FTPStat:
+    st_size: Optional[int] = None
 
 @dataclasses.dataclass
 class IngestResult:
@@ -37,28 +91,152 @@ class IngestResult:
 
 class Hashing:
     @staticmethod
-    def md5_of_file(path: Path, chunk_size: int = 1 << 20) -> str:
-        m = hashlib.md5()
-        with path.open("rb") as f:
-            for chunk in iter(lambda: f.read(chunk_size), b""):
-                m.update(chunk)
+    def new(algo: str = "md5"):
+        if algo == "blake3":
+            if not _HAS_BLAKE3:
+                raise RuntimeError("blake3 is not installed. `pip install blake3` to enable BLAKE3 digests.")
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        # Integrity checks, not signatures: let OpenSSL pick its fastest implementation.
+        return hashlib.new(algo, usedforsecurity=False)
+
+    @staticmethod
+    def digest_of_file(path: Path, algo: str = "md5", chunk_size: int = 1 << 20) -> str:
+        m = Hashing.new(algo)
+        if algo == "blake3":
+            m.update_mmap(path)
+            return m.hexdigest()
+        # Unbuffered: our reads are already large, so the 8KB file buffer only adds a copy.
+        with path.open("rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            # mmap rejects empty files, and 32-bit address spaces can't map very large ones.
+            if size and (sys.maxsize > 2 ** 32 or size <= _MMAP_32BIT_LIMIT):
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    m.update(mm)  # one zero-copy call into the digest
+                return m.hexdigest()
+            buf = bytearray(chunk_size)
+            mv = memoryview(buf)
+            while n := f.readinto(buf):
+                m.update(mv[:n])
         return m.hexdigest()
 
+    @staticmethod
+    def md5_of_file(path: Path, chunk_size: int = 1 << 20) -> str:
+        return Hashing.digest_of_file(path, "md5", chunk_size)
+
+    @staticmethod
+    def digest_many(paths: Sequence[Path], algo: str = "md5", max_workers: Optional[int] = None) -> List[str]:
+        """Hash independent files concurrently, one stream per worker; order matches ``paths``."""
+        total = sum(os.path.getsize(p) for p in paths)
+        if len(paths) <= 1 or total < _INLINE_HASH_MAX_BYTES:
+            return [Hashing.digest_of_file(p, algo) for p in paths]
+        workers = min(len(paths), max_workers or os.cpu_count() or 1)
+        # The mmap'd update() releases the GIL for the whole file, so threads hash
+        # on separate cores without the start-up cost or __main__ re-import of processes.
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(Hashing.digest_of_file, paths, repeat(algo)))
+
+@functools.lru_cache(maxsize=32)
+def _compile_glob(pattern: str) -> Tuple[str, Callable[[str], Any]]:
+    """Literal prefix and compiled matcher for a glob; the prefix rejects most names without the regex."""
+    prefix = re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+    return prefix, re.compile(fnmatch.translate(pattern)).match
+
+def _part_path(local_path: Path) -> Path:
+    # Transfers land here and are renamed into place once complete, so an
+    # existing .part file is always an interrupted download of ours.
+    return local_path.with_name(local_path.name + ".part")
+
+def _part_stamp_path(part_path: Path) -> Path:
+    return part_path.with_name(part_path.name + ".meta")
+
+def _part_stamp(size: Optional[int], mtime: Optional[int]) -> Optional[str]:
+    return None if size is None or mtime is None else f"{size} {int(mtime)}\n"
+
+def _begin_part(part_path: Path, size: Optional[int], mtime: Optional[int]) -> None:
+    """Record which remote version (size, mtime) a fresh ``part_path`` is a copy of."""
+    stamp = _part_stamp(size, mtime)
+    stamp_path = _part_stamp_path(part_path)
+    if stamp is None:
+        # Unknown version: never resumed.
+        stamp_path.unlink(missing_ok=True)
+    else:
+        stamp_path.write_text(stamp)
+
+def _finish_part(part_path: Path, local_path: Path) -> None:
+    os.replace(part_path, local_path)
+    _part_stamp_path(part_path).unlink(missing_ok=True)
+
+def _resume_offset(part_path: Path, remote_size: Optional[int], remote_mtime: Optional[int],
+                   resume: bool) -> int:
+    """Bytes of ``part_path`` a transfer can continue from; 0 means start over."""
+    stamp = _part_stamp(remote_size, remote_mtime)
+    if not resume or stamp is None or not part_path.exists():
+        return 0
+    # A .part of an earlier version (republished under the same name) is not a prefix of this one.
+    try:
+        if _part_stamp_path(part_path).read_text() != stamp:
+            return 0
+    except OSError:
+        return 0
+    offset = part_path.stat().st_size
+    # A partial file larger than the remote one can't be a prefix of it.
+    return offset if offset <= remote_size else 0
+
 class _SFTPClientWrapper:
     def __init__(self, host: str, username: str, password: str, port: int = 22):
         if not _HAS_PARAMIKO:
             raise RuntimeError("paramiko is not installed. `pip install paramiko` to enable SFTP.")
         import paramiko  # local import to satisfy type checkers
-        self._transport = paramiko.Transport((host, port))
+        sock = socket.create_connection((host, port))
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_SIZE)
+        self._transport = paramiko.Transport(
+            sock,
+            default_window_size=_SFTP_WINDOW_SIZE,
+            default_max_packet_size=_SFTP_MAX_PACKET_SIZE,
+        )
         self._transport.connect(username=username, password=password)
         self._sftp = paramiko.SFTPClient.from_transport(self._transport)
 
-    def listdir(self, path: str) -> List[str]:
-        return [f.filename for f in self._sftp.listdir_attr(path)]
+    def listdir_with_attrs(self, path: str) -> List[Tuple[str, Optional[int], Optional[int]]]:
+        return [(f.filename, f.st_size, f.st_mtime) for f in self._sftp.listdir_attr(path)]
+
+    def download(self, remote_path: str, local_path: Path, hasher: Optional[Any] = None,
+                 resume: bool = False, size: Optional[int] = None, mtime: Optional[int] = None) -> int:
+        """Download ``remote_path``; returns the offset resumed from (0 for a full transfer).
 
-    def download(self, remote_path: str, local_path: Path) -> None:
+        ``size`` and ``mtime`` come from the listing when known; they identify the
+        remote version a leftover ``.part`` file must match to be resumed.
+        """
         local_path.parent.mkdir(parents=True, exist_ok=True)
-        self._sftp.get(remote_path, str(local_path))
+        if size is None or mtime is None:
+            st = self._sftp.stat(remote_path)
+            size = st.st_size if size is None else size
+            mtime = st.st_mtime if mtime is None else mtime
+        file_size = size
+        part = _part_path(local_path)
+        offset = _resume_offset(part, file_size, mtime, resume)
+        if not offset:
+            _begin_part(part, file_size, mtime)
+        if not offset or offset < file_size:
+            mode = "ab" if offset else "wb"
+            with self._sftp.open(remote_path, "rb") as rf, part.open(mode, buffering=_WRITE_BUFFER_SIZE) as f:
+                rf.set_pipelined(True)
+                if offset:
+                    LOG.info("Resuming %s at byte %d", remote_path, offset)
+                    rf.seek(offset)
+                # Issue all read requests up front rather than one 32KB round-trip at a time.
+                rf.prefetch(file_size)
+                if hasher is None:
+                    shutil.copyfileobj(rf, f, length=_COPY_CHUNK_SIZE)
+                else:
+                    # Hash while streaming so validation never re-reads the local file.
+                    while chunk := rf.read(_COPY_CHUNK_SIZE):
+                        f.write(chunk)
+                        hasher.update(chunk)
+        _finish_part(part, local_path)
+        return offset
 
     def stat(self, remote_path: str):
         return self._sftp.stat(remote_path)
@@ -69,6 +247,15 @@ class _SFTPClientWrapper:
         finally:
             self._transport.close()
 
+def _mlsd_mtime(modify: Optional[str]) -> Optional[int]:
+    # MLSD "modify" facts are UTC timestamps: YYYYMMDDHHMMSS[.sss]
+    if not modify:
+        return None
+    try:
+        return calendar.timegm(time.strptime(modify[:14], "%Y%m%d%H%M%S"))
+    except ValueError:
+        return None
+
 class _FTPClientWrapper:
     def __init__(self, host: str, username: str, password: str, port: int = 21, timeout: int = 60):
         import ftplib as _ftplib
@@ -85,10 +272,56 @@ class _FTPClientWrapper:
             self._ftp.cwd(orig)
         return files
 
-    def download(self, remote_path: str, local_path: Path) -> None:
+    def listdir_with_attrs(self, path: str) -> List[Tuple[str, Optional[int], Optional[int]]]:
+        try:
+            entries = list(self._ftp.mlsd(path, facts=["type", "size", "modify"]))
+        except ftplib.error_perm:
+            # No MLSD support; sizes are left for the caller to SIZE per matched file.
+            return [(name, None, None) for name in self.listdir(path)]
+        result: List[Tuple[str, Optional[int], Optional[int]]] = []
+        for name, facts in entries:
+            if facts.get("type", "file") in ("cdir", "pdir", "dir"):
+                continue
+            size = facts.get("size")
+            result.append((name, int(size) if size is not None else None, _mlsd_mtime(facts.get("modify"))))
+        return result
+
+    def download(self, remote_path: str, local_path: Path, hasher: Optional[Any] = None,
+                 resume: bool = False, size: Optional[int] = None, mtime: Optional[int] = None) -> int:
+        """Download ``remote_path``; returns the offset resumed from (0 for a full transfer).
+
+        ``size`` and ``mtime`` come from the listing when known; they identify the
+        remote version a leftover ``.part`` file must match to be resumed.
+        """
         local_path.parent.mkdir(parents=True, exist_ok=True)
-        with local_path.open("wb") as f:
-            self._ftp.retrbinary(f"RETR {remote_path}", f.write)
+        part = _part_path(local_path)
+        # Without a listed size and mtime the .part can't be matched to a version, so it isn't resumed.
+        offset = _resume_offset(part, size, mtime, resume)
+        if not offset:
+            _begin_part(part, size, mtime)
+            self._retrieve(remote_path, part, 0, hasher)
+        elif offset < size:
+            LOG.info("Resuming %s at byte %d", remote_path, offset)
+            try:
+                self._retrieve(remote_path, part, offset, hasher)
+            except ftplib.error_perm as e:
+                # REST (or RETR after it) was refused before any data arrived;
+                # fetch the whole file rather than leave a .part we can never resume.
+                LOG.warning("Resume of %s refused (%s); downloading from the start", remote_path, e)
+                offset = 0
+                self._retrieve(remote_path, part, 0, hasher)
+        _finish_part(part, local_path)
+        return offset
+
+    def _retrieve(self, remote_path: str, part: Path, offset: int, hasher: Optional[Any]) -> None:
+        with part.open("ab" if offset else "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            def _write_and_hash(block: bytes) -> None:
+                f.write(block)
+                hasher.update(block)
+
+            callback = f.write if hasher is None else _write_and_hash
+            self._ftp.retrbinary(f"RETR {remote_path}", callback, blocksize=_COPY_CHUNK_SIZE,
+                                 rest=offset or None)
 
     def stat(self, remote_path: str):
         # Not all FTP servers support SIZE; handle gracefully
@@ -97,8 +330,7 @@ class _FTPClientWrapper:
             size = self._ftp.size(remote_path)
         except Exception:
             pass
-        FTPStat = dataclasses.make_dataclass("FTPStat", [("st_size", Optional[int])])
-        return FTPStat(size)
+        return _FTPStat(size)
 
     def close(self) -> None:
         try:
@@ -106,6 +338,73 @@ class _FTPClientWrapper:
         except Exception:
             self._ftp.close()
 
+class _SessionPool:
+    """Client sessions shared by download workers.
+
+    Grows on demand, but once the server refuses a new session (many cap
+    concurrent logins per user) workers wait for one of the open sessions
+    instead of failing their file.
+    """
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._idle: List[Any] = []
+        self._live = 0  # open sessions plus connects in progress
+        self._can_grow = True
+        self._cond = threading.Condition()
+
+    def add(self, client) -> None:
+        with self._cond:
+            self._live += 1
+            self._idle.append(client)
+            self._cond.notify()
+
+    def acquire(self):
+        with self._cond:
+            if self._idle:
+                return self._idle.pop()
+            if self._can_grow:
+                self._live += 1
+            else:
+                return self._wait_for_idle()
+        try:
+            return self._factory()
+        except Exception:
+            with self._cond:
+                self._live -= 1
+                self._cond.notify_all()
+                if self._live == 0:
+                    raise
+                self._can_grow = False
+                return self._wait_for_idle()
+
+    def _wait_for_idle(self):
+        # Caller holds self._cond.
+        while not self._idle:
+            if self._live == 0:
+                raise RuntimeError("no SFTP/FTP session available")
+            self._cond.wait()
+        return self._idle.pop()
+
+    def release(self, client) -> None:
+        with self._cond:
+            self._idle.append(client)
+            self._cond.notify()
+
+    def discard(self, client) -> None:
+        try:
+            client.close()
+        finally:
+            with self._cond:
+                self._live -= 1
+                self._cond.notify_all()
+
+    def close_all(self) -> None:
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._live -= len(idle)
+        for client in idle:
+            client.close()
+
 @dataclasses.dataclass
 class FTPIngestor:
     host: str
@@ -116,35 +415,52 @@ class FTPIngestor:
     use_sftp: bool = True
     filename_glob: str = "*"
     enforce_size_match: bool = False
-    enforce_md5_match: bool = False
+    enforce_md5_match: bool = False  # checks the digest for `algo` (md5 by default)
+    max_workers: int = 4
+    algo: str = "md5"
+    resume: bool = True
+    port: Optional[int] = None  # defaults to 22 for SFTP, 21 for FTP
+
+    def __post_init__(self) -> None:
+        _check_algo(self.algo)
+
+    def _matches_glob(self, name: str) -> bool:
+        prefix, match = _compile_glob(self.filename_glob)
+        return name.startswith(prefix) and match(name) is not None
 
     def _client(self):
+        """Open a fresh client; each download worker gets its own session."""
         if self.use_sftp:
             LOG.info("Connecting via SFTP to %s", self.host)
-            return _SFTPClientWrapper(self.host, self.username, self.password)
+            return _SFTPClientWrapper(self.host, self.username, self.password, port=self.port or 22)
         LOG.info("Connecting via FTP to %s", self.host)
-        return _FTPClientWrapper(self.host, self.username, self.password)
+        return _FTPClientWrapper(self.host, self.username, self.password, port=self.port or 21)
 
     def list_remote(self) -> List[FileSpec]:
         client = self._client()
         try:
-            entries = client.listdir(self.remote_dir)
-            matched = [e for e in entries if fnmatch.fnmatch(e, self.filename_glob)]
-            result: List[FileSpec] = []
-            for name in matched:
-                rp = f"{self.remote_dir.rstrip('/')}/{name}"
-                size = None
+            return self._list_remote_with(client)
+        finally:
+            client.close()
+
+    def _list_remote_with(self, client) -> List[FileSpec]:
+        result: List[FileSpec] = []
+        # Sizes come back with the listing, so files are only stat'ed when the server omitted one.
+        for name, size, mtime in client.listdir_with_attrs(self.remote_dir):
+            if not self._matches_glob(name):
+                continue
+            rp = f"{self.remote_dir.rstrip('/')}/{name}"
+            if size is None:
                 try:
                     st = client.stat(rp)
                     size = getattr(st, "st_size", None)
+                    mtime = mtime if mtime is not None else getattr(st, "st_mtime", None)
                 except Exception:
                     pass
-                result.append(FileSpec(path=rp, size=size))
-            return result
-        finally:
-            client.close()
+            result.append(FileSpec(path=rp, size=size, algo=self.algo, mtime=mtime))
+        return result
 
-    def _validate_download(self, remote: FileSpec, local: Path) -> Tuple[bool, List[str]]:
+    def _validate_download(self, remote: FileSpec, local: Path, digest: Optional[str] = None) -> Tuple[bool, List[str]]:
         reasons: List[str] = []
         ok = True
         if self.enforce_size_match and remote.size is not None:
@@ -152,34 +468,138 @@ class FTPIngestor:
             if int(actual) != int(remote.size):
                 ok = False
                 reasons.append(f"size mismatch local={actual} remote={remote.size}")
-        if self.enforce_md5_match and remote.md5:
-            digest = Hashing.md5_of_file(local)
-            if digest.lower() != remote.md5.lower():
+        if self.enforce_md5_match and remote.digest:
+            if digest is None:
+                digest = Hashing.digest_of_file(local, remote.algo)
+            if digest.lower() != remote.digest.lower():
                 ok = False
-                reasons.append(f"md5 mismatch local={digest} remote={remote.md5}")
+                reasons.append(f"{remote.algo} mismatch local={digest} remote={remote.digest}")
         return ok, reasons
 
-    def download_all(self) -> IngestResult:
-        client = self._client()
+    def _download_one(self, pool: _SessionPool, spec: FileSpec) -> Tuple[Path, bool, List[str], Optional[str]]:
+        local_path = self.local_dir / Path(spec.path).name
+        # Build the hasher before borrowing a session so a failure here can't strand one.
+        try:
+            hasher = Hashing.new(spec.algo) if self.enforce_md5_match and spec.digest else None
+        except Exception as e:
+            return local_path, False, [str(e)], None
+        try:
+            client = pool.acquire()
+        except Exception as e:
+            return local_path, False, [str(e)], None
+        try:
+            LOG.info("Downloading %s -> %s", spec.path, local_path)
+            resumed_from = client.download(spec.path, local_path, hasher=hasher, resume=self.resume,
+                                           size=spec.size, mtime=spec.mtime)
+        except Exception as e:
+            # The session may be broken; drop it rather than returning it to the pool.
+            pool.discard(client)
+            return local_path, False, [str(e)], None
+        pool.release(client)
+        # A resumed transfer only streamed the tail, so leave the full hash to validation.
+        digest = hasher.hexdigest() if hasher is not None and not resumed_from else None
+        return local_path, True, [], digest
+
+    def _validate_downloads(self, fetched: List[Tuple[FileSpec, Path, Optional[str]]]) -> Tuple[List[Path], List[str]]:
         downloaded: List[Path] = []
+        errors: List[str] = []
+        # Files that were not hashed in-stream are hashed here as one concurrent batch.
+        late: Dict[Path, str] = {}
+        unhashed = [(spec, local) for spec, local, digest in fetched
+                    if digest is None and self.enforce_md5_match and spec.digest]
+        for algo in {spec.algo for spec, _ in unhashed}:
+            paths = [local for spec, local in unhashed if spec.algo == algo]
+            try:
+                late.update(zip(paths, Hashing.digest_many(paths, algo)))
+            except Exception as e:
+                # Fall back to per-file hashing so one bad file doesn't fail the batch.
+                LOG.warning("Batch %s hashing failed, retrying per file: %s", algo, e)
+        for spec, local, digest in fetched:
+            try:
+                ok, reasons = self._validate_download(spec, local, digest or late.get(local))
+            except Exception as e:
+                errors.append(f"{spec.path}: {e}")
+                continue
+            if not ok:
+                errors.append(f"validation failed for {spec.path}: {', '.join(reasons)}")
+                continue
+            downloaded.append(local)
+        return downloaded, errors
+
+    def download_all(self) -> IngestResult:
         skipped: List[str] = []
         errors: List[str] = []
+        fetched: List[Tuple[FileSpec, Path, Optional[str]]] = []
+        pool = _SessionPool(self._client)
+        # List on the first session, then hand it to the workers instead of reconnecting.
+        client = self._client()
+        pool.add(client)
         try:
-            for spec in self.list_remote():
-                local_path = self.local_dir / Path(spec.path).name
-                try:
-                    LOG.info("Downloading %s -> %s", spec.path, local_path)
-                    client.download(spec.path, local_path)
-                    ok, reasons = self._validate_download(spec, local_path)
-                    if not ok:
-                        errors.append(f"validation failed for {spec.path}: {', '.join(reasons)}")
-                        continue
-                    downloaded.append(local_path)
-                except Exception as e:
-                    errors.append(f"{spec.path}: {e}")
-            return IngestResult(downloaded=downloaded, skipped=skipped, errors=errors)
+            specs = self._list_remote_with(client)
+            with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as ex:
+                results = ex.map(lambda spec: self._download_one(pool, spec), specs)
+                # Results come back in listing order, so no locking is needed here.
+                for spec, (local_path, ok, reasons, digest) in zip(specs, results):
+                    if ok:
+                        fetched.append((spec, local_path, digest))
+                    else:
+                        errors.append(f"{spec.path}: {'; '.join(reasons)}")
         finally:
-            client.close()
+            pool.close_all()
+        downloaded, validation_errors = self._validate_downloads(fetched)
+        return IngestResult(downloaded=downloaded, skipped=skipped, errors=errors + validation_errors)
+
+    async def download_all_async(self) -> IngestResult:
+        """SFTP-only variant of ``download_all`` running every transfer on one asyncssh connection.
+
+        Unlike ``download_all``, this path ignores ``resume`` (files are always
+        fetched whole) and does not hash in-stream, so enforced digests are
+        computed from the local files after the transfers finish.
+        """
+        if not self.use_sftp:
+            raise RuntimeError("download_all_async requires SFTP; use download_all for FTP.")
+        if not _HAS_ASYNCSSH:
+            raise RuntimeError("asyncssh is not installed. `pip install asyncssh` to enable async SFTP.")
+        skipped: List[str] = []
+        errors: List[str] = []
+        fetched: List[Tuple[FileSpec, Path, Optional[str]]] = []
+        sem = asyncio.Semaphore(max(1, self.max_workers))
+        LOG.info("Connecting via async SFTP to %s", self.host)
+        # Host keys are not checked, matching the paramiko Transport path.
+        async with asyncssh.connect(self.host, port=self.port or 22, username=self.username,
+                                    password=self.password, known_hosts=None) as conn:
+            async with conn.start_sftp_client() as sftp:
+                specs: List[FileSpec] = []
+                for entry in await sftp.readdir(self.remote_dir):
+                    name = entry.filename
+                    if name in (".", "..") or not self._matches_glob(name):
+                        continue
+                    rp = f"{self.remote_dir.rstrip('/')}/{name}"
+                    specs.append(FileSpec(path=rp, size=entry.attrs.size, algo=self.algo,
+                                          mtime=entry.attrs.mtime))
+
+                async def _get(spec: FileSpec) -> Tuple[Path, bool, List[str]]:
+                    local_path = self.local_dir / Path(spec.path).name
+                    async with sem:
+                        try:
+                            LOG.info("Downloading %s -> %s", spec.path, local_path)
+                            local_path.parent.mkdir(parents=True, exist_ok=True)
+                            await sftp.get(spec.path, str(local_path), block_size=_ASYNC_BLOCK_SIZE,
+                                           max_requests=_ASYNC_MAX_REQUESTS)
+                        except Exception as e:
+                            return local_path, False, [str(e)]
+                    return local_path, True, []
+
+                results = await asyncio.gather(*(_get(spec) for spec in specs))
+        for spec, (local_path, ok, reasons) in zip(specs, results):
+            if ok:
+                # No in-stream digest here; validation batches the hashing instead.
+                fetched.append((spec, local_path, None))
+            else:
+                errors.append(f"{spec.path}: {'; '.join(reasons)}")
+        loop = asyncio.get_running_loop()
+        downloaded, validation_errors = await loop.run_in_executor(None, self._validate_downloads, fetched)
+        return IngestResult(downloaded=downloaded, skipped=skipped, errors=errors + validation_errors)
 
 if __name__ == "__main__":
     # Example — replace with real values before running.
@@ -4,31 +4,88 @@ Load metric definitions (YAML/JSON) and render a SELECT.
 """
 from __future__ import annotations
 from pathlib import Path
-from typing import Dict, Any
-import json, sys
+from typing import Callable, Dict, Any, Mapping
+import copy, functools, json, sys
 
 try:
     import yaml  # type: ignore
     _HAS_YAML = True
+    # Prefer the libyaml-backed loader when PyYAML was built with it.
+    try:
+        from yaml import CSafeLoader as _YLoader  # type: ignore
+    except ImportError:
+        from yaml import SafeLoader as _YLoader  # type: ignore
 except Exception:
     _HAS_YAML = False
 
+# orjson parses straight from bytes, skipping the decode step
+try:
+    import orjson  # type: ignore
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_YAML_SUFFIXES = {".yml", ".yaml"}
+
 def load_config(path: Path) -> Dict[str, Any]:
-    text = path.read_text(encoding="utf-8")
-    if path.suffix.lower() in {".yml", ".yaml"}:
-        if not _HAS_YAML:
-            raise RuntimeError("Install PyYAML to use YAML configs, or provide JSON instead.")
-        return yaml.safe_load(text)  # type: ignore
-    return json.loads(text)
-
-def render_sql_select(cfg: Dict[str, Any]) -> str:
-    parts = []
-    for m in cfg.get("metrics", []):
-        name = m["name"]
-        expr = m["expression"]
-        parts.append(f"    {expr} AS {name}")
-    select_list = ",\n".join(parts) if parts else "    1 AS no_metrics_configured"
-    return f"SELECT\n{select_list}\nFROM fact_cost;"
+    """Load a config; YAML parses are cached per (path, mtime) and each caller gets its own copy."""
+    if path.suffix.lower() not in _YAML_SUFFIXES:
+        # Reparsing JSON is cheaper than deep-copying a memoized result.
+        return _as_mapping(path, _json_loads(path.read_bytes()))
+    resolved = path.resolve()
+    return copy.deepcopy(_load_yaml_cached(str(resolved), resolved.stat().st_mtime_ns))
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    path = Path(path_str)
+    return _as_mapping(path, _parse_yaml(path))
+
+def _as_mapping(path: Path, cfg: Any) -> Dict[str, Any]:
+    if cfg is None:  # empty YAML document
+        return {}
+    if not isinstance(cfg, dict):
+        raise ValueError(f"{path}: expected a mapping at the top level, got {type(cfg).__name__}")
+    return cfg
+
+def _parse_yaml(path: Path) -> Any:
+    if not _HAS_YAML:
+        raise RuntimeError("Install PyYAML to use YAML configs, or provide JSON instead.")
+    # Parsed YAML is cached as a JSON sidecar, reused while it is at least as new as the source.
+    cache = path.with_suffix(path.suffix + ".json")
+    try:
+        if cache.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            return _json_loads(cache.read_bytes())
+    except (OSError, ValueError):
+        pass
+    result = yaml.load(path.read_text(encoding="utf-8"), Loader=_YLoader)  # type: ignore
+    try:
+        dumped = json.dumps(result)
+        # Only cache documents JSON reproduces exactly (e.g. not int or bool keys).
+        if json.loads(dumped) == result:
+            cache.write_text(dumped, encoding="utf-8")
+    except (OSError, TypeError, ValueError):
+        pass  # read-only directory or YAML values JSON can't represent
+    return result
+
+_SELECT_TEMPLATE = "SELECT\n%s\nFROM fact_cost;"
+
+def render_sql_select(cfg: Mapping[str, Any]) -> str:
+    metrics = cfg.get("metrics") or ()
+    select_list = ",\n".join(f"    {m['expression']} AS {m['name']}" for m in metrics) or "    1 AS no_metrics_configured"
+    return _SELECT_TEMPLATE % select_list
+
+def compile_sql_renderer(cfg: Mapping[str, Any]) -> Callable[[], str]:
+    """Specialize render_sql_select for ``cfg``: the SQL is rendered once, now.
+
+    The returned function is a snapshot; later changes to ``cfg`` (including its
+    nested ``metrics`` list) are not reflected, so compile again after editing.
+    """
+    sql = render_sql_select(cfg)
+
+    def _render() -> str:
+        return sql
+
+    return _render
 
 if __name__ == "__main__":
     if len(sys.argv) < 2: